@@ -1,3 +1,4 @@
+import inspect
 import time
 from pathlib import Path
 from typing import Optional
@@ -14,6 +15,9 @@ from dataloaders import BucketedSceneFlowInputSequence, BucketedSceneFlowOutputS
 
 from .model_saver import ModelOutSaver, FlowNoSave, FlowSave
 
+# The fused Adam kernel was added in PyTorch 1.13.
+_ADAM_SUPPORTS_FUSED = "fused" in inspect.signature(optim.Adam).parameters
+
 
 def _get_cfg_or_default(cfg, key, default, key_transform=lambda e: e):
     return key_transform(getattr(cfg, key)) if hasattr(cfg, key) else default
@@ -34,6 +38,8 @@ class ModelWrapper(pl.LightningModule):
         self.train_forward_args = _get_cfg_or_default(cfg, "train_forward_args", {})
         self.val_forward_args = _get_cfg_or_default(cfg, "val_forward_args", {})
         self.has_labels = _get_cfg_or_default(cfg, "has_labels", True)
+        # Run the validation forward pass under bf16 autocast.
+        self.use_amp: bool = _get_cfg_or_default(cfg, "use_amp", False)
 
         self.save_output_folder: Optional[Path] = _get_cfg_or_default(
             cfg, "save_output_folder", None, Path
@@ -74,8 +80,20 @@ class ModelWrapper(pl.LightningModule):
             checkpoint.pop("optimizer_states")
             checkpoint.pop("lr_schedulers")
 
+    def transfer_batch_to_device(
+        self, batch: list[BucketedSceneFlowInputSequence], device: torch.device, dataloader_idx: int
+    ) -> list[BucketedSceneFlowInputSequence]:
+        # Lightning only issues non_blocking copies for raw tensors, so move the sequences
+        # ourselves; with pinned batches this overlaps the H2D copy with compute.
+        return [sequence.to(device, non_blocking=True) for sequence in batch]
+
     def configure_optimizers(self):
-        self.optimizer = optim.Adam(self.parameters(), lr=self.lr)
+        # Fused Adam updates every parameter in a single kernel launch, but requires all
+        # parameters to live on CUDA.
+        parameters = list(self.parameters())
+        fused = _ADAM_SUPPORTS_FUSED and len(parameters) > 0 and all(p.is_cuda for p in parameters)
+        adam_kwargs = {"fused": True} if fused else {}
+        self.optimizer = optim.Adam(parameters, lr=self.lr, **adam_kwargs)
         return self.optimizer
 
     def training_step(
@@ -99,7 +117,19 @@ class ModelWrapper(pl.LightningModule):
         ):
             output_batch = self.model_out_saver.load_saved_batch(input_batch)
         else:
-            output_batch = self.model(input_batch, **self.val_forward_args)
+            with torch.autocast(
+                device_type=self.device.type, dtype=torch.bfloat16, enabled=self.use_amp
+            ):
+                output_batch = self.model(input_batch, **self.val_forward_args)
+            if self.use_amp:
+                # Keep the saved flows and the metric accumulation in float32.
+                output_batch = [
+                    BucketedSceneFlowOutputSequence(
+                        ego_flows=output.ego_flows.float(),
+                        valid_flow_mask=output.valid_flow_mask,
+                    )
+                    for output in output_batch
+                ]
             self.model_out_saver.save_batch(input_batch, output_batch)
 
         assert len(output_batch) == len(
@@ -115,11 +145,13 @@ class ModelWrapper(pl.LightningModule):
         if not self.has_labels:
             return {}
 
-        gathered_evaluator_list: list[EvalWrapper] = [
-            None for _ in range(torch.distributed.get_world_size())
-        ]
+        # Only rank 0 computes the results, so gather the evaluators there rather than
+        # all-gathering every evaluator onto every rank.
+        gathered_evaluator_list: Optional[list[EvalWrapper]] = None
+        if self.global_rank == 0:
+            gathered_evaluator_list = [None for _ in range(torch.distributed.get_world_size())]
         # Get the output from each process
-        torch.distributed.all_gather_object(gathered_evaluator_list, self.evaluator)
+        torch.distributed.gather_object(self.evaluator, gathered_evaluator_list, dst=0)
 
         if self.global_rank != 0:
             return {}
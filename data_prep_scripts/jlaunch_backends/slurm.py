@@ -1,3 +1,4 @@
+import os
 import click
 from pathlib import Path
 from .shared_utils import run_cmd
@@ -46,7 +47,7 @@ def backend_slurm(
     blacklist_substring: str,
 ):
     job_dir = Path(job_dir).absolute()
-    num_prior_jobs = len(list([e for e in job_dir.iterdir() if e.is_dir()]))
+    num_prior_jobs = get_next_job_index(job_dir)
     jobdir_path = job_dir / f"{num_prior_jobs:06d}"
     jobdir_path.mkdir(exist_ok=True, parents=True)
     job_runtime_mins = runtime_mins if runtime_hours is None else runtime_hours * 60
@@ -84,6 +85,23 @@ def backend_slurm(
     print(f"Config files written to {jobdir_path.absolute()}")
 
 
+def get_next_job_index(job_dir: Path) -> int:
+    # Track the next job index in a counter file rather than stat-ing every entry of the
+    # job dir, which gets slow on networked filesystems once thousands of jobs exist.
+    counter_path = job_dir / ".next"
+    if counter_path.exists():
+        job_index = int(counter_path.read_text().strip() or 0)
+    else:
+        # Seed the counter from any job folders made before the counter existed.
+        job_index = len([e for e in job_dir.iterdir() if e.is_dir()])
+
+    # Write then rename so the counter file is never observed half written.
+    tmp_counter_path = job_dir / f".next.{os.getpid()}"
+    tmp_counter_path.write_text(f"{job_index + 1}\n")
+    os.replace(tmp_counter_path, counter_path)
+    return job_index
+
+
 def load_available_nodes():
     res = run_cmd("sinfo --Node | awk '{print $1}' | tail +2", return_stdout=True)
     available_nodes = res.split("\n")
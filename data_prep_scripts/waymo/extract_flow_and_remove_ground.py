@@ -336,6 +336,25 @@ def is_ground_points(raster_heightmap, global_to_raster_se2,
     return is_ground_boolean_arr
 
 
+def _make_flow_lineset(pc0: np.ndarray, pc1_endpoints: np.ndarray,
+                       color: np.ndarray) -> o3d.geometry.LineSet:
+    # Line i connects point i in pc0 to its flowed endpoint i in pc1_endpoints.
+    num_points = len(pc0)
+    points = np.concatenate([pc0, pc1_endpoints], axis=0)
+    lines = np.empty((num_points, 2), dtype=np.int32)
+    lines[:, 0] = np.arange(num_points)
+    lines[:, 1] = lines[:, 0] + num_points
+    # Open3D needs a contiguous buffer, so materialize the broadcast once.
+    colors = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(color, dtype=np.float64), (num_points, 3)))
+
+    line_set = o3d.geometry.LineSet()
+    line_set.points = o3d.utility.Vector3dVector(points)
+    line_set.lines = o3d.utility.Vector2iVector(lines)
+    line_set.colors = o3d.utility.Vector3dVector(colors)
+    return line_set
+
+
 def visualize_point_cloud_flow(point_cloud: PointCloud, flow: np.ndarray):
 
     print("Visualizing point cloud and flow")
@@ -351,18 +370,10 @@ def visualize_point_cloud_flow(point_cloud: PointCloud, flow: np.ndarray):
     geometries.append(pcd)
 
     # Add line set
-    line_set = o3d.geometry.LineSet()
-    line_set_points = np.concatenate(
-        [point_cloud.points, flowed_point_cloud.points], axis=0)
-
-    lines = np.array([[i, i + len(point_cloud)]
-                      for i in range(len(point_cloud))])
-    line_set.points = o3d.utility.Vector3dVector(line_set_points)
-    line_set.lines = o3d.utility.Vector2iVector(lines)
     # Line set is blue
-    line_set.colors = o3d.utility.Vector3dVector([[1, 0, 0]
-                                                  for _ in range(len(lines))])
-    geometries.append(line_set)
+    geometries.append(
+        _make_flow_lineset(point_cloud.points, flowed_point_cloud.points,
+                           np.array([1, 0, 0])))
 
     # Visualize the pointcloud
     o3d.visualization.draw_geometries(geometries)
@@ -20,7 +20,8 @@ from pointclouds import (
     from_fixed_array_np,
     from_fixed_array_torch,
     to_fixed_array_np,
-    from_fixed_array_valid_mask_torch,
+    from_fixed_array_valid_mask_np,
+    transform_pc,
 )
 
 
@@ -124,17 +125,19 @@ class BucketedSceneFlowInputSequence:
         ego_pc = self.get_full_ego_pc(idx)
         sensor_to_ego, ego_to_global = self.get_pc_transform_matrices(idx)
         sensor_to_global = torch.matmul(ego_to_global, sensor_to_ego)
-        # Ego PC is Nx3, we need to add another entry to make it Nx4 for the transformation
-        ego_pc = torch.cat([ego_pc, torch.ones(ego_pc.shape[0], 1, device=ego_pc.device)], dim=1)
-        return torch.matmul(sensor_to_global, ego_pc.T).T[:, :3]
+        # Transform as (N, 4) @ (4, 4)^T so the result stays row-major; transforming as
+        # (4, 4) @ (4, N) and transposing back hands out a column-major (N, 3) view, which
+        # makes every downstream per-point gather and reduction strided.
+        return transform_pc(ego_pc, sensor_to_global)
 
     def get_full_global_pc_gt_flowed(self, idx: int) -> torch.Tensor:
         ego_pc = self.get_full_ego_pc_gt_flowed(idx)
         sensor_to_ego, ego_to_global = self.get_pc_transform_matrices(idx)
         sensor_to_global = torch.matmul(ego_to_global, sensor_to_ego)
-        # Ego PC is Nx3, we need to add another entry to make it Nx4 for the transformation
-        ego_pc = torch.cat([ego_pc, torch.ones(ego_pc.shape[0], 1, device=ego_pc.device)], dim=1)
-        return torch.matmul(sensor_to_global, ego_pc.T).T[:, :3]
+        # Transform as (N, 4) @ (4, 4)^T so the result stays row-major; transforming as
+        # (4, 4) @ (4, N) and transposing back hands out a column-major (N, 3) view, which
+        # makes every downstream per-point gather and reduction strided.
+        return transform_pc(ego_pc, sensor_to_global)
 
     def get_global_pc(self, idx: int) -> torch.Tensor:
         full_pc = self.get_full_global_pc(idx)
@@ -339,25 +342,57 @@ class BucketedSceneFlowInputSequence:
             loader_type=loader_type,
         )
 
-    def to(self, device: str | torch.device) -> "BucketedSceneFlowInputSequence":
+    def to(
+        self, device: str | torch.device, non_blocking: bool = False
+    ) -> "BucketedSceneFlowInputSequence":
         """
         Copy tensors in this batch to the target device.
 
         Args:
             device: the string (and optional ordinal) used to construct the device object, e.g., 'cuda:0'
+            non_blocking: if True and the tensors are in pinned memory, copy asynchronously
+                with respect to the host.
         """
         # Update tensors to the new device
-        self.full_pc = self.full_pc.to(device)
-        self.full_pc_mask = self.full_pc_mask.to(device)
-        self.full_pc_gt_flowed = self.full_pc_gt_flowed.to(device)
-        self.full_pc_gt_flowed_mask = self.full_pc_gt_flowed_mask.to(device)
-        self.full_pc_gt_class = self.full_pc_gt_class.to(device)
-        self.pc_poses_sensor_to_ego = self.pc_poses_sensor_to_ego.to(device)
-        self.pc_poses_ego_to_global = self.pc_poses_ego_to_global.to(device)
-        self.rgb_images = self.rgb_images.to(device)
-        self.rgb_poses_sensor_to_ego = self.rgb_poses_sensor_to_ego.to(device)
-        self.rgb_poses_ego_to_global = self.rgb_poses_ego_to_global.to(device)
+        self.full_pc = self.full_pc.to(device, non_blocking=non_blocking)
+        self.full_pc_mask = self.full_pc_mask.to(device, non_blocking=non_blocking)
+        self.full_pc_gt_flowed = self.full_pc_gt_flowed.to(device, non_blocking=non_blocking)
+        self.full_pc_gt_flowed_mask = self.full_pc_gt_flowed_mask.to(
+            device, non_blocking=non_blocking
+        )
+        self.full_pc_gt_class = self.full_pc_gt_class.to(device, non_blocking=non_blocking)
+        self.pc_poses_sensor_to_ego = self.pc_poses_sensor_to_ego.to(
+            device, non_blocking=non_blocking
+        )
+        self.pc_poses_ego_to_global = self.pc_poses_ego_to_global.to(
+            device, non_blocking=non_blocking
+        )
+        self.rgb_images = self.rgb_images.to(device, non_blocking=non_blocking)
+        self.rgb_poses_sensor_to_ego = self.rgb_poses_sensor_to_ego.to(
+            device, non_blocking=non_blocking
+        )
+        self.rgb_poses_ego_to_global = self.rgb_poses_ego_to_global.to(
+            device, non_blocking=non_blocking
+        )
+
+        return self
+
+    def pin_memory(self) -> "BucketedSceneFlowInputSequence":
+        """
+        Pin the tensors in this object to page-locked memory.
 
+        Called by the DataLoader pin memory thread when `pin_memory=True`.
+        """
+        self.full_pc = self.full_pc.pin_memory()
+        self.full_pc_mask = self.full_pc_mask.pin_memory()
+        self.full_pc_gt_flowed = self.full_pc_gt_flowed.pin_memory()
+        self.full_pc_gt_flowed_mask = self.full_pc_gt_flowed_mask.pin_memory()
+        self.full_pc_gt_class = self.full_pc_gt_class.pin_memory()
+        self.pc_poses_sensor_to_ego = self.pc_poses_sensor_to_ego.pin_memory()
+        self.pc_poses_ego_to_global = self.pc_poses_ego_to_global.pin_memory()
+        self.rgb_images = self.rgb_images.pin_memory()
+        self.rgb_poses_sensor_to_ego = self.rgb_poses_sensor_to_ego.pin_memory()
+        self.rgb_poses_ego_to_global = self.rgb_poses_ego_to_global.pin_memory()
         return self
 
     def clone(self) -> "BucketedSceneFlowInputSequence":
@@ -534,35 +569,55 @@ class BucketedSceneFlowOutputSequence:
     def __len__(self) -> int:
         return self.ego_flows.shape[0]
 
-    def to(self, device: str | torch.device) -> "BucketedSceneFlowOutputSequence":
+    def to(
+        self, device: str | torch.device, non_blocking: bool = False
+    ) -> "BucketedSceneFlowOutputSequence":
         """
         Copy tensors in this batch to the target device.
 
         Args:
             device: the string (and optional ordinal) used to construct the device object ex. 'cuda:0'
+            non_blocking: if True and the tensors are in pinned memory, copy asynchronously
+                with respect to the host.
         """
-        self.ego_flows = self.ego_flows.to(device)
-        self.valid_flow_mask = self.valid_flow_mask.to(device)
+        self.ego_flows = self.ego_flows.to(device, non_blocking=non_blocking)
+        self.valid_flow_mask = self.valid_flow_mask.to(device, non_blocking=non_blocking)
 
         return self
 
+    def pin_memory(self) -> "BucketedSceneFlowOutputSequence":
+        """
+        Pin the tensors in this object to page-locked memory.
+        """
+        self.ego_flows = self.ego_flows.pin_memory()
+        self.valid_flow_mask = self.valid_flow_mask.pin_memory()
+        return self
+
     def to_ego_lidar_flow_list(self) -> list[EgoLidarFlow]:
         """
         Convert the ego flows and valid flow mask to a list of EgoLidarFlow objects.
         """
 
-        def _to_ego_lidar_flow(
-            padded_flow: torch.Tensor, padded_mask: torch.Tensor
-        ) -> EgoLidarFlow:
-            unpad = from_fixed_array_valid_mask_torch(padded_mask)
+        # Pack the flows and masks into a single (K - 1, PadN, 4) tensor so that the whole
+        # sequence comes back to the host in one transfer, then unpad each frame on the host.
+        padded_flows_and_masks = (
+            torch.cat([self.ego_flows, self.valid_flow_mask.unsqueeze(-1)], dim=-1)
+            .detach()
+            .cpu()
+            .numpy()
+        )
+
+        def _to_ego_lidar_flow(padded_flow_and_mask: np.ndarray) -> EgoLidarFlow:
+            padded_mask = padded_flow_and_mask[:, 3]
+            unpad = from_fixed_array_valid_mask_np(padded_mask)
             return EgoLidarFlow(
-                full_flow=padded_flow[unpad].detach().cpu().numpy(),
-                mask=(padded_mask[unpad] != 0).detach().cpu().numpy(),
+                full_flow=padded_flow_and_mask[unpad, :3],
+                mask=padded_mask[unpad] != 0,
             )
 
         return [
-            _to_ego_lidar_flow(flow, mask)
-            for flow, mask in zip(self.ego_flows, self.valid_flow_mask)
+            _to_ego_lidar_flow(padded_flow_and_mask)
+            for padded_flow_and_mask in padded_flows_and_masks
         ]
 
     def reverse(self) -> "BucketedSceneFlowOutputSequence":
@@ -22,22 +22,38 @@ class DynamicScatterWrapper(DynamicScatter):
         # Calculate voxel indices for each point
         voxel_indices = coors.long()
 
-        # Find unique voxels and their indices
-        unique_voxels, inverse_indices = torch.unique(voxel_indices, return_inverse=True, dim=0)
-
-        # Aggregate points that fall into the same voxel
-        aggregated_points = torch.zeros((unique_voxels.size(0), points.size(1)), dtype=points.dtype)
-
-        for i in range(points.size(1)):  # Iterate through point features
-            # Accumulate points features for each voxel
-            aggregated_points[:, i] = torch.zeros_like(aggregated_points[:, i]).scatter_add_(
-                0, inverse_indices, points[:, i]
-            )
+        if voxel_indices.size(0) == 0:
+            return points.new_zeros((0, points.size(1))), voxel_indices
+
+        # Find unique voxels and their indices. Row-wise unique (dim=0) is a slow
+        # lexicographic sort, so linearize each voxel coordinate into a single key and
+        # do a 1D sort instead. Offsetting by the min keeps the keys non-negative and
+        # the key order identical to the lexicographic order of the coordinates.
+        min_indices = voxel_indices.min(dim=0).values
+        shifted_indices = voxel_indices - min_indices
+        extents = shifted_indices.max(dim=0).values + 1
+        voxel_keys = shifted_indices[:, 0] * extents[1] + shifted_indices[:, 1]
+        voxel_keys = voxel_keys * extents[2] + shifted_indices[:, 2]
+        unique_keys, inverse_indices = torch.unique(voxel_keys, return_inverse=True)
+        unique_shifted_voxels = torch.stack(
+            [
+                unique_keys // (extents[1] * extents[2]),
+                (unique_keys // extents[2]) % extents[1],
+                unique_keys % extents[2],
+            ],
+            dim=1,
+        )
+        unique_voxels = unique_shifted_voxels + min_indices
+
+        # Aggregate points that fall into the same voxel, accumulating all point
+        # features for each voxel in a single pass over the points
+        aggregated_points = points.new_zeros((unique_voxels.size(0), points.size(1)))
+        aggregated_points.index_add_(0, inverse_indices, points)
 
         if self.average_points:
             # Compute counts for each voxel to average
-            counts = torch.zeros((unique_voxels.size(0),), dtype=points.dtype).scatter_add_(
-                0, inverse_indices, torch.ones_like(inverse_indices, dtype=points.dtype)
+            counts = torch.bincount(inverse_indices, minlength=unique_voxels.size(0)).to(
+                points.dtype
             )
             # Avoid division by zero
             counts = torch.where(counts > 0, counts, torch.ones_like(counts))
@@ -225,7 +225,7 @@ class PillarFeatureNet(nn.Module):
             features_ls.append(f_center)
 
         if self._with_distance:
-            points_dist = torch.norm(features[:, :, :3], 2, 2, keepdim=True)
+            points_dist = torch.linalg.vector_norm(features[:, :, :3], dim=2, keepdim=True)
             features_ls.append(points_dist)
 
         # Combine together feature decorations
@@ -400,7 +400,7 @@ class DynamicPillarFeatureNet(PillarFeatureNet):
             features_ls.append(f_center)
 
         if self._with_distance:
-            points_dist = torch.norm(features[:, :3], 2, 1, keepdim=True)
+            points_dist = torch.linalg.vector_norm(features[:, :3], dim=1, keepdim=True)
             features_ls.append(points_dist)
 
         # Combine together feature decorations
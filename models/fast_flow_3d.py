@@ -96,7 +96,7 @@ class FastFlow3DBucketedLoaderLoss:
             est_flow = output_item.get_full_ego_flow(0)
             flow_difference = est_flow - gt_flow
             loss_difference = flow_difference[valid_loss_mask]
-            diff_l2 = torch.norm(loss_difference, dim=1, p=2).mean()
+            diff_l2 = torch.linalg.vector_norm(loss_difference, dim=1).mean()
             total_loss += diff_l2
         return {
             "loss": total_loss,
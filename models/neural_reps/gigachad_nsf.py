@@ -35,16 +35,17 @@ class GigaChadRawMLP(NSFPRawMLP):
         )
 
 
-def _make_time_feature(idx: int) -> torch.Tensor:
-    return torch.tensor([idx], dtype=torch.float32)
+def _make_time_feature(pc: torch.Tensor, idx: int) -> torch.Tensor:
+    # Built directly on the point cloud's device; this runs every optimization step, so
+    # building it on the host would mean an Nx1 host to device copy each iteration.
+    return torch.full((pc.shape[0], 1), idx, dtype=torch.float32, device=pc.device)
 
 
 def _make_input_feature(pc: torch.Tensor, idx: int) -> torch.Tensor:
-    time_feature = _make_time_feature(idx)  # 1x1
-    pc_additional_dim = time_feature.repeat(pc.shape[0], 1)
+    pc_additional_dim = _make_time_feature(pc, idx)  # Nx1
     # Concatenate into an Nx4 tensor
     concatenated_pc = torch.cat(
-        [pc, pc_additional_dim.to(pc.device)],
+        [pc, pc_additional_dim],
         dim=-1,
     )
 
@@ -1,4 +1,5 @@
 import time
+from typing import Optional
 
 import torch
 import torch.nn as nn
@@ -15,10 +16,14 @@ class NSFPModel(BaseModel):
         iterations: int = 5000,
         patience: int = 100,
         min_delta: float = 0.00005,
+        compile_mode: Optional[str] = None,
     ) -> None:
         super().__init__()
         self.optimization_loop = OptimizationLoop(
-            iterations=iterations, min_delta=min_delta, patience=patience
+            iterations=iterations,
+            min_delta=min_delta,
+            patience=patience,
+            compile_mode=compile_mode,
         )
 
     def _validate_input(self, batched_sequence: list[BucketedSceneFlowInputSequence]) -> None:
@@ -38,8 +38,9 @@ class TruncatedChamferLossProblem(BaseCostProblem):
             x.shape[0] == y.shape[0] == 1
         ), f"x.shape[0] = {x.shape[0]}, y.shape[0] = {y.shape[0]}"
 
-        x_lengths = torch.Tensor([x.shape[1]]).to(x.device).long()
-        y_lengths = torch.Tensor([y.shape[1]]).to(y.device).long()
+        # Create the lengths on device; cost() is called every optimization step.
+        x_lengths = torch.full((1,), x.shape[1], dtype=torch.long, device=x.device)
+        y_lengths = torch.full((1,), y.shape[1], dtype=torch.long, device=y.device)
 
         x_nn = knn_points(x, y, lengths1=x_lengths, lengths2=y_lengths, K=1)
         y_nn = knn_points(y, x, lengths1=y_lengths, lengths2=x_lengths, K=1)
@@ -17,6 +17,7 @@ class OptimizationLoop:
         min_delta: float = 0.00005,
         weight_decay: float = 0,
         compile: bool = True,
+        compile_mode: Optional[str] = None,
     ):
         self.iterations = iterations
         self.lr = lr
@@ -24,6 +25,10 @@ class OptimizationLoop:
         self.patience = patience
         self.min_delta = min_delta
         self.compile = compile
+        # Passed through to torch.compile. The problem shapes are fixed for every step of a
+        # single optimize() call, so "reduce-overhead" (CUDA graphs) can replay the small
+        # MLP kernels without per-launch overhead.
+        self.compile_mode = compile_mode
 
     def optimize(
         self,
@@ -36,7 +41,7 @@ class OptimizationLoop:
     ) -> BucketedSceneFlowOutputSequence:
         model = model.train()
         if self.compile:
-            model = torch.compile(model)
+            model = torch.compile(model, mode=self.compile_mode)
         problem = problem.clone().detach().requires_grad_(True)
 
         if patience is None:
@@ -58,9 +63,12 @@ class OptimizationLoop:
             optimizer.zero_grad()
             cost_problem = model.optim_forward_single(problem)
             cost = cost_problem.cost()
+            # Read the cost back to the host once per step; every comparison below uses
+            # this float instead of forcing its own device sync.
+            cost_value = cost.item()
 
-            if cost.item() < lowest_cost:
-                lowest_cost = cost.item()
+            if cost_value < lowest_cost:
+                lowest_cost = cost_value
                 # Run in eval mode to avoid unnecessary computation
                 with torch.inference_mode():
                     best_output = model.forward_single(problem)
@@ -68,10 +76,10 @@ class OptimizationLoop:
             cost.backward()
             optimizer.step()
 
-            if early_stopping.step(cost):
+            if early_stopping.step(cost_value):
                 break
 
-            bar.set_postfix(cost=f"{cost.item():0.4f}")
+            bar.set_postfix(cost=f"{cost_value:0.4f}")
 
         assert best_output is not None, "Best output is None; optimization failed"
         return best_output
@@ -44,7 +44,7 @@ class EarlyStopping:
         if self.patience == 0:
             return False
 
-        if torch.isnan(perf_metric):
+        if np.isnan(perf_metric):
             return True
 
         if self._is_better(perf_metric):
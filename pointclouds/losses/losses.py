@@ -50,8 +50,8 @@ def pc0_to_pc1_distance(
     if pc1.ndim == 2:
         pc1 = pc1.unsqueeze(0)
 
-    pc0_shape_tensor = torch.LongTensor([pc0.shape[0]]).to(pc0.device)
-    pc1_shape_tensor = torch.LongTensor([pc1.shape[0]]).to(pc1.device)
+    pc0_shape_tensor = torch.full((1,), pc0.shape[0], dtype=torch.long, device=pc0.device)
+    pc1_shape_tensor = torch.full((1,), pc1.shape[0], dtype=torch.long, device=pc1.device)
     pc0_to_pc1_knn = knn_points(
         p1=pc0, p2=pc1, lengths1=pc0_shape_tensor, lengths2=pc1_shape_tensor, K=1
     )
@@ -0,0 +1,34 @@
+from models.embedders.dynamic_scatter_wrapper import DynamicScatterWrapper
+import pytest
+import torch
+
+
+def _reference_scatter(points: torch.Tensor, coors: torch.Tensor, average_points: bool):
+    # Naive row-wise unique + per-voxel mean, used as ground truth for the CPU path.
+    unique_voxels, inverse_indices = torch.unique(coors.long(), return_inverse=True, dim=0)
+    aggregated_points = torch.stack(
+        [points[inverse_indices == idx].sum(dim=0) for idx in range(unique_voxels.size(0))]
+    )
+    if average_points:
+        counts = torch.bincount(inverse_indices, minlength=unique_voxels.size(0))
+        aggregated_points = aggregated_points / counts.unsqueeze(-1).to(points.dtype)
+    return aggregated_points, unique_voxels
+
+
+@pytest.mark.parametrize("average_points", [True, False])
+def test_forward_cpu_matches_reference(average_points: bool):
+    generator = torch.Generator().manual_seed(0)
+    points = torch.randn((5000, 4), generator=generator)
+    coors = torch.randint(0, 16, (5000, 3), generator=generator, dtype=torch.int32)
+    coors[:100] = -1
+
+    scatter = DynamicScatterWrapper(
+        voxel_size=[0.2, 0.2, 4],
+        point_cloud_range=[-51.2, -51.2, -3, 51.2, 51.2, 1],
+        average_points=average_points,
+    )
+    aggregated_points, unique_voxels = scatter.forward_cpu(points, coors)
+    expected_points, expected_voxels = _reference_scatter(points, coors, average_points)
+
+    assert torch.equal(unique_voxels, expected_voxels)
+    assert torch.allclose(aggregated_points, expected_points, atol=1e-5)
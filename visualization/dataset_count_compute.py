@@ -332,30 +332,56 @@ class SpeedBucketResult:
     def __init__(self, category_id_list: List[int], speed_bucket_ticks: List[float]):
         self.category_id_list = category_id_list
         self.speed_bucket_ticks = speed_bucket_ticks
+        # Bucket bounds are fixed for the lifetime of the result, so build them once
+        # rather than re-zipping / re-converting the tick list on every update.
+        self._speed_bucket_ranges = list(zip(speed_bucket_ticks, speed_bucket_ticks[1:]))
+        self._speed_bucket_ticks_array = np.asarray(speed_bucket_ticks, dtype=np.float64)
         self.count_array = np.zeros(
-            (len(self.category_id_list), len(self.speed_bucket_ranges())), dtype=np.int64
+            (len(self.category_id_list), len(self._speed_bucket_ranges)), dtype=np.int64
         )
 
         self.category_id_to_category_idx = {id: idx for idx, id in enumerate(self.category_id_list)}
 
         self.category_idx_to_category_id = {idx: id for idx, id in enumerate(self.category_id_list)}
 
+        # Dense lookup table from (category id - min id) to category idx, so per-point ids
+        # can be mapped with a single gather instead of per-id dict lookups. Ids not in
+        # the category list map to -1.
+        category_id_array = np.asarray(self.category_id_list, dtype=np.int64)
+        self._category_id_offset = category_id_array.min()
+        self._category_id_to_category_idx_lut = np.full(
+            category_id_array.max() - self._category_id_offset + 1, -1, dtype=np.int64
+        )
+        self._category_id_to_category_idx_lut[category_id_array - self._category_id_offset] = (
+            np.arange(len(category_id_array))
+        )
+
     def speed_bucket_ranges(self):
-        return list(zip(self.speed_bucket_ticks, self.speed_bucket_ticks[1:]))
+        return list(self._speed_bucket_ranges)
 
     def update(self, pc: PointCloud, flowed_pc: PointCloud, category_ids: np.ndarray):
         flow = flowed_pc.points - pc.points
-        for category_id in np.unique(category_ids):
-            category_idx = self.category_id_to_category_idx[category_id]
-            category_mask = category_ids == category_id
-            category_flow = flow[category_mask]
-            # convert to m/s
-            category_speeds = np.linalg.norm(category_flow, axis=1) * 10.0
-            category_speed_buckets = np.digitize(category_speeds, self.speed_bucket_ticks) - 1
-            for speed_bucket_idx in range(len(self.speed_bucket_ranges())):
-                bucket_mask = category_speed_buckets == speed_bucket_idx
-                num_points = np.sum(bucket_mask)
-                self.count_array[category_idx, speed_bucket_idx] += num_points
+        num_speed_buckets = len(self._speed_bucket_ranges)
+        # convert to m/s
+        speeds = np.linalg.norm(flow, axis=1) * 10.0
+        # Bucket every point once; NaN speeds land past the last bucket and are dropped.
+        speed_buckets = np.digitize(speeds, self._speed_bucket_ticks_array) - 1
+        in_range_mask = (speed_buckets >= 0) & (speed_buckets < num_speed_buckets)
+
+        # Map each point's category id to its row in the count array, then count every
+        # (category, speed bucket) cell with a single bincount over the flattened array.
+        lut_idxes = np.asarray(category_ids, dtype=np.int64) - self._category_id_offset
+        assert np.all(
+            (lut_idxes >= 0) & (lut_idxes < len(self._category_id_to_category_idx_lut))
+        ), f"category_ids must be in the category_id_list, but got {np.unique(category_ids)}"
+        category_idxes = self._category_id_to_category_idx_lut[lut_idxes]
+        assert np.all(
+            category_idxes >= 0
+        ), f"category_ids must be in the category_id_list, but got {np.unique(category_ids)}"
+        flat_idxes = category_idxes * num_speed_buckets + speed_buckets
+        self.count_array += np.bincount(
+            flat_idxes[in_range_mask], minlength=self.count_array.size
+        ).reshape(self.count_array.shape)
 
     def __add__(self, other):
         if isinstance(other, int):
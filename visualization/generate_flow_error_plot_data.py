@@ -141,10 +141,11 @@ def accumulate_flow_scatter(supervised_flow,
     # Compute the flow difference
     flow_error_xy = (unsupervised_flow - supervised_flow)
 
-    # Create the grid
-    accumulation_grid = np.zeros(
-        (int(grid_radius_meters * 2 * cells_per_meter + 1),
-         int(grid_radius_meters * 2 * cells_per_meter + 1)))
+    # Create the grid as a flat, contiguous buffer; it is reshaped to 2D on return.
+    # It only holds per-frame point counts, so int32 is plenty and is half the size of
+    # the float64 default.
+    grid_size = int(grid_radius_meters * 2 * cells_per_meter + 1)
+    accumulation_grid = np.zeros(grid_size * grid_size, dtype=np.int32)
 
     # Compute the grid indices for flow_error_xy using np digitize
     grid_indices_x = np.digitize(
@@ -158,13 +159,14 @@ def accumulate_flow_scatter(supervised_flow,
             -grid_radius_meters, grid_radius_meters,
             int(grid_radius_meters * 2 * cells_per_meter) + 1)) - 1
 
-    grid_indices = np.array([grid_indices_x, grid_indices_y]).T
-    unique_grid_indices, unique_counts = np.unique(grid_indices,
-                                                   axis=0,
-                                                   return_counts=True)
-
-    accumulation_grid[unique_grid_indices[:, 0],
-                      unique_grid_indices[:, 1]] = unique_counts
+    # Count hits per cell directly on the flat grid. Out of range indices (-1) wrap to
+    # the last cell, matching the negative indexing of the 2D grid.
+    flat_grid_indices = np.ravel_multi_index((grid_indices_x, grid_indices_y),
+                                             (grid_size, grid_size),
+                                             mode='wrap')
+    accumulation_grid += np.bincount(flat_grid_indices,
+                                     minlength=accumulation_grid.size)
+    accumulation_grid = accumulation_grid.reshape(grid_size, grid_size)
 
     # import matplotlib.pyplot as plt
     # plt.matshow(accumulation_grid)